@@ -2,6 +2,10 @@
 import re
 from textblob import TextBlob
 
+AMOUNT_PATTERN = re.compile(r"(?:₹|Rs\.?|INR)?\s?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?")
+DATE_PATTERN = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
+UNSAFE_CHARS_PATTERN = re.compile(r"[^a-zA-Z0-9\s₹.,:/-]")
+
 def extract_entities(text):
     """
     Extract common financial entities such as amounts and dates.
@@ -12,8 +16,8 @@ def extract_entities(text):
     Returns:
         dict: Extracted entities.
     """
-    amounts = re.findall(r"(?:₹|Rs\.?|INR)?\s?\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?", text)
-    dates = re.findall(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b", text)
+    amounts = AMOUNT_PATTERN.findall(text)
+    dates = DATE_PATTERN.findall(text)
     return {"amounts": amounts, "dates": dates}
 
 def detect_sentiment(text):
@@ -37,5 +41,5 @@ def clean_input(text):
     Returns:
         str: Cleaned lowercase text.
     """
-    text = re.sub(r"[^a-zA-Z0-9\s₹.,:/-]", "", text)
+    text = UNSAFE_CHARS_PATTERN.sub("", text)
     return text.lower().strip()
\ No newline at end of file
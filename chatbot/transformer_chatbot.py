@@ -1,8 +1,28 @@
 # Transformer-based QA
-from transformers import pipeline
+import streamlit as st
 
-# Load transformer-based question-answering pipeline (DistilBERT fine-tuned on SQuAD)
-qa_pipeline = pipeline("question-answering", model="distilbert-base-cased-distilled-squad")
+@st.cache_resource(show_spinner="Loading QA model...")
+def load_qa_pipeline():
+    """
+    Loads the transformer-based question-answering pipeline (DistilBERT fine-tuned on SQuAD).
+
+    Cached as a Streamlit resource, so the model is loaded once per process
+    and shared across reruns and sessions.
+    """
+    # Imported here so importing this module does not pull in PyTorch
+    from transformers import pipeline
+
+    return pipeline("question-answering", model="distilbert-base-cased-distilled-squad")
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _answer(question, user_context):
+    # Repeated questions against the same context skip the model entirely.
+    # Failures raise instead of returning a message, so they are never cached.
+    result = load_qa_pipeline()({
+        "context": user_context,
+        "question": question
+    })
+    return result["answer"]
 
 def answer_query(question, user_context):
     """
@@ -19,10 +39,6 @@ def answer_query(question, user_context):
         return "Please provide both a question and financial context."
 
     try:
-        result = qa_pipeline({
-            "context": user_context,
-            "question": question
-        })
-        return result["answer"]
+        return _answer(question.strip(), user_context.strip())
     except Exception as e:
         return f"Sorry, I couldn't process your query: {str(e)}"
\ No newline at end of file
@@ -1,8 +1,4 @@
 # KMeans for budget
-import pandas as pd
-from sklearn.cluster import KMeans
-import numpy as np
-
 def recommend_budget(transactions_df):
     """
     Suggests a monthly budget based on user spending clusters.
@@ -13,20 +9,16 @@ def recommend_budget(transactions_df):
     Returns:
         dict: Recommended monthly budget by category.
     """
-    df = transactions_df.copy()
-    df = df[df['amount'] > 0]
+    from sklearn.cluster import KMeans
 
-    pivot = df.pivot_table(values='amount', index='category', aggfunc='sum').fillna(0)
-    pivot = pivot.reset_index()
+    df = transactions_df[transactions_df['amount'] > 0]
 
-    model = KMeans(n_clusters=3, random_state=42)
-    pivot['cluster'] = model.fit_predict(pivot[['amount']])
+    totals = df.groupby('category', as_index=False)['amount'].sum()
 
-    avg_cluster = pivot.groupby('cluster')['amount'].mean().idxmax()
-    recommended = pivot[pivot['cluster'] == avg_cluster][['category', 'amount']]
+    model = KMeans(n_clusters=3, random_state=42)
+    totals['cluster'] = model.fit_predict(totals[['amount']])
 
-    budget = {}
-    for _, row in recommended.iterrows():
-        budget[row['category']] = round(row['amount'], 2)
+    avg_cluster = totals.groupby('cluster')['amount'].mean().idxmax()
+    recommended = totals[totals['cluster'] == avg_cluster]
 
-    return budget
\ No newline at end of file
+    return dict(zip(recommended['category'], recommended['amount'].round(2)))
\ No newline at end of file
@@ -1,4 +1,10 @@
 # Suggest investments
+ALLOCATIONS = {
+    "conservative": {"FD/Bonds": 0.6, "Mutual Funds": 0.3, "Gold": 0.1},
+    "moderate": {"Mutual Funds": 0.5, "Stocks": 0.3, "Gold": 0.2},
+    "aggressive": {"Stocks": 0.6, "Mutual Funds": 0.3, "Crypto": 0.1},
+}
+
 def suggest_investment_strategy(risk_profile, amount):
     """
     Suggests where to invest based on risk profile.
@@ -10,17 +16,8 @@ def suggest_investment_strategy(risk_profile, amount):
     Returns:
         dict: Suggested asset allocation
     """
-    allocation = {
-        "conservative": {"FD/Bonds": 0.6, "Mutual Funds": 0.3, "Gold": 0.1},
-        "moderate": {"Mutual Funds": 0.5, "Stocks": 0.3, "Gold": 0.2},
-        "aggressive": {"Stocks": 0.6, "Mutual Funds": 0.3, "Crypto": 0.1},
-    }
-
-    if risk_profile not in allocation:
+    allocation = ALLOCATIONS.get(risk_profile)
+    if allocation is None:
         return {"Error": "Invalid risk profile"}
 
-    suggestion = {}
-    for asset, ratio in allocation[risk_profile].items():
-        suggestion[asset] = round(amount * ratio, 2)
-
-    return suggestion
\ No newline at end of file
+    return {asset: round(amount * ratio, 2) for asset, ratio in allocation.items()}
\ No newline at end of file
@@ -11,10 +11,8 @@ def extract_receipt_data(image):
         dict: Extracted structured receipt data.
     """
     raw_text = extract_text_from_image(image)
-    lines = raw_text.strip().split("\n")
-    lines = [line.strip() for line in lines if line.strip()]
-    
-    vendor = lines[0] if lines else "Unknown Vendor"
+    # Vendor is the first non-blank line; stop scanning as soon as it is found
+    vendor = next((line.strip() for line in raw_text.split("\n") if line.strip()), "Unknown Vendor")
     amount = extract_amount(raw_text)
     date = extract_date(raw_text)
     category = predict_category(raw_text)
@@ -1,6 +1,13 @@
 import streamlit as st
 from utils.gamify import get_user_badges
 
+LOCKED_BADGES = (
+    "📈 10% Monthly Saving Streak",
+    "💳 First Credit Paid On-Time",
+    "📘 5 Journals Written",
+    "💸 ₹50K Investment Mark",
+)
+
 def run():
     st.title("🏅 Your Badges & Achievements")
 
@@ -14,11 +21,5 @@ def run():
         st.info("No badges yet. Start saving, investing, and tracking!")
 
     st.markdown("### 🔒 Locked Badges")
-    locked = [
-        "📈 10% Monthly Saving Streak",
-        "💳 First Credit Paid On-Time",
-        "📘 5 Journals Written",
-        "💸 ₹50K Investment Mark"
-    ]
-    for badge in locked:
+    for badge in LOCKED_BADGES:
         st.warning(f"🔒 {badge} — Complete tasks to unlock.")
\ No newline at end of file
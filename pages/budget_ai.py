@@ -17,5 +17,4 @@ def run():
     budget = recommend_budget(df)
 
     st.markdown("### 📋 Recommended Budget (₹):")
-    for category, amt in budget.items():
-        st.write(f"- **{category}**: ₹{amt}")
+    st.markdown("\n".join(f"- **{category}**: ₹{amt}" for category, amt in budget.items()))
@@ -11,21 +11,22 @@ def run():
 
     st.markdown("### 📊 Suggested Portfolio")
     alloc = suggest_investment_strategy(risk, amt)
-    for k, v in alloc.items():
-        st.write(f"- {k}: ₹{v}")
+    st.markdown("\n".join(f"- {k}: ₹{v}" for k, v in alloc.items()))
 
     st.markdown("---")
     st.markdown("### 📈 ROI & CAGR Calculator")
 
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        invested = st.number_input("Invested Amount", value=10000.0)
-    with col2:
-        current = st.number_input("Current Value", value=12500.0)
-    with col3:
-        years = st.number_input("Years", value=1.0)
+    with st.form("roi_form"):
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            invested = st.number_input("Invested Amount", value=10000.0)
+        with col2:
+            current = st.number_input("Current Value", value=12500.0)
+        with col3:
+            years = st.number_input("Years", value=1.0)
 
-    if st.button("Calculate"):
-        roi = calculate_roi(invested, current)
-        cagr = calculate_cagr(invested, current, years)
-        st.success(f"ROI: {roi}% | CAGR: {cagr}%")
+        submitted = st.form_submit_button("Calculate")
+        if submitted:
+            roi = calculate_roi(invested, current)
+            cagr = calculate_cagr(invested, current, years)
+            st.success(f"ROI: {roi}% | CAGR: {cagr}%")
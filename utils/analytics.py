@@ -1,11 +1,15 @@
-import pandas as pd
-import plotly.express as px
-from utils.db import get_user_transactions
+from utils.db import get_connection
 
 def get_summary_stats(username):
-    df = get_user_transactions(username)
-    income = df[df["amount"] > 0]["amount"].sum()
-    expense = df[df["amount"] < 0]["amount"].sum()
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT
+            COALESCE(SUM(CASE WHEN amount > 0 THEN amount END), 0.0),
+            COALESCE(SUM(CASE WHEN amount < 0 THEN amount END), 0.0)
+        FROM transactions WHERE username = ?
+    """, (username,))
+    income, expense = cur.fetchone()
     return {
         "income": round(income, 2),
         "expense": round(abs(expense), 2),
@@ -13,14 +17,25 @@ def get_summary_stats(username):
     }
 
 def plot_spending_chart(username):
-    df = get_user_transactions(username)
-    df['date'] = pd.to_datetime(df['date'], errors='coerce')
-    df = df.dropna(subset=['date'])
+    import plotly.graph_objects as go
 
-    if df.empty:
+    # Dates are stored as ISO text, so SQLite can bucket them by month itself;
+    # strftime() yields NULL for anything unparseable, which is skipped
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT strftime('%Y-%m', date), SUM(amount)
+        FROM transactions
+        WHERE username = ? AND strftime('%Y-%m', date) IS NOT NULL
+        GROUP BY 1 ORDER BY 1
+    """, (username,))
+    rows = cur.fetchall()
+
+    if not rows:
         return None
 
-    df_grouped = df.groupby(df['date'].dt.to_period("M"))["amount"].sum().reset_index()
-    df_grouped['date'] = df_grouped['date'].astype(str)
-    fig = px.bar(df_grouped, x='date', y='amount', title="Monthly Net Spending")
+    months, amounts = zip(*rows)
+    # Same hover text px.bar produced for these columns
+    fig = go.Figure(go.Bar(x=months, y=amounts, hovertemplate="date=%{x}<br>amount=%{y}<extra></extra>"))
+    fig.update_layout(title="Monthly Net Spending", xaxis_title="date", yaxis_title="amount")
     return fig
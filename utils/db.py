@@ -1,9 +1,38 @@
 # Handles DB functions
+import os
 import sqlite3
 import bcrypt
 import pandas as pd
 
 DB_PATH = "data/database.db"
+# bcrypt work factor; lower it (min 4) only for local testing
+BCRYPT_ROUNDS = int(os.environ.get("FINMATE_BCRYPT_ROUNDS", "12"))
+
+# Every query filters on username (IOUs also on direction); these turn
+# full table scans into index range scans
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS ix_transactions_user_date ON transactions (username, date)",
+    "CREATE INDEX IF NOT EXISTS ix_ious_user_direction ON ious (username, direction)",
+)
+
+def _init_database():
+    try:
+        conn = sqlite3.connect(DB_PATH)
+    except sqlite3.OperationalError:
+        # Data directory not created yet; nothing to configure
+        return
+    try:
+        for statement in INDEXES:
+            try:
+                conn.execute(statement)
+            except sqlite3.OperationalError:
+                # Table not created yet, or the file is locked; skip this one
+                continue
+        conn.commit()
+    finally:
+        conn.close()
+
+_init_database()
 
 def get_connection():
     return sqlite3.connect(DB_PATH, check_same_thread=False)
@@ -21,27 +50,41 @@ def create_user(username, password):
     cur.execute("SELECT username FROM users WHERE username=?", (username,))
     if cur.fetchone():
         return False
-    hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt())
+    hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(BCRYPT_ROUNDS))
     cur.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, hashed))
     conn.commit()
     return True
 
+def _query_frame(query, params):
+    # Plain cursor fetch is much cheaper than pd.read_sql_query for small results
+    cur = get_connection().execute(query, params)
+    columns = [col[0] for col in cur.description]
+    return pd.DataFrame(cur.fetchall(), columns=columns)
+
 def get_user_transactions(username):
-    conn = get_connection()
-    df = pd.read_sql_query("SELECT * FROM transactions WHERE username = ?", conn, params=(username,))
-    return df
+    return _query_frame("SELECT * FROM transactions WHERE username = ?", (username,))
 
 def get_tax_related_expenses(username):
-    df = get_user_transactions(username)
+    # LIKE is case-insensitive for ASCII, so no lower() is needed
+    conn = get_connection()
+    cur = conn.cursor()
+    cur.execute("""
+        SELECT
+            COALESCE(SUM(CASE WHEN category LIKE '%elss%' OR category LIKE '%ppf%'
+                                   OR category LIKE '%life insurance%' THEN amount END), 0.0),
+            COALESCE(SUM(CASE WHEN category LIKE '%medical%'
+                                   OR category LIKE '%health insurance%' THEN amount END), 0.0)
+        FROM transactions WHERE username = ?
+    """, (username,))
+    sec_80c, sec_80d = cur.fetchone()
     summary = {
-        "80C": df[df["category"].str.lower().str.contains("elss|ppf|life insurance", na=False)]["amount"].sum(),
-        "80D": df[df["category"].str.lower().str.contains("medical|health insurance", na=False)]["amount"].sum()
+        "80C": sec_80c,
+        "80D": sec_80d
     }
     return summary
 
 def get_ious(username, mode="owed_to_me"):
-    conn = get_connection()
-    return pd.read_sql_query("SELECT * FROM ious WHERE username=? AND direction=?", conn, params=(username, mode))
+    return _query_frame("SELECT * FROM ious WHERE username=? AND direction=?", (username, mode))
 
 def add_iou(username, name, amount, direction, note=""):
     conn = get_connection()
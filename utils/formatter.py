@@ -2,18 +2,22 @@
 import re
 from datetime import datetime
 
+AMOUNT_PATTERN = re.compile(r"(?:₹|Rs\.?|INR)?\s?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)")
+DATE_PATTERN = re.compile(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b")
+DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%m/%d/%Y", "%d/%m/%y")
+
 def extract_amount(text):
-    matches = re.findall(r"(?:₹|Rs\.?|INR)?\s?(\d{1,3}(?:,\d{3})*(?:\.\d{1,2})?)", text)
+    matches = AMOUNT_PATTERN.findall(text)
     if matches:
         return float(matches[-1].replace(',', ''))
     return 0.0
 
 def extract_date(text):
-    matches = re.findall(r"\b\d{1,2}[/-]\d{1,2}[/-]\d{2,4}\b", text)
+    matches = DATE_PATTERN.findall(text)
     for date_str in matches:
-        for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%m/%d/%Y", "%d/%m/%y"):
+        for fmt in DATE_FORMATS:
             try:
                 return datetime.strptime(date_str, fmt).date()
-            except:
+            except ValueError:
                 continue
     return None
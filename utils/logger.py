@@ -1,6 +1,31 @@
 # Logger
-import datetime
+import logging
+import os
+import sys
 
-def log(message, level="INFO"):
-    now = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    print(f"[{level}] {now} - {message}")
+def _level_number(level):
+    """
+    Resolves a level name or number, falling back to INFO for unknown names.
+    """
+    if isinstance(level, int):
+        return level
+    levelno = logging.getLevelName(str(level).upper())
+    return levelno if isinstance(levelno, int) else logging.INFO
+
+logger = logging.getLogger("finmate")
+if not logger.handlers:
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(logging.Formatter("[%(levelname)s] %(asctime)s - %(message)s", "%Y-%m-%d %H:%M:%S"))
+    logger.addHandler(_handler)
+    logger.setLevel(_level_number(os.environ.get("FINMATE_LOG_LEVEL", "DEBUG")))
+    logger.propagate = False
+
+def log(message, level="INFO", *args):
+    """
+    Logs a message through the shared "finmate" logger.
+
+    `level` may be a name ("INFO") or a logging constant (logging.WARNING).
+    Pass %-style args instead of pre-formatting the message, so filtered-out
+    messages cost only a level check.
+    """
+    logger.log(_level_number(level), message, *args)